@@ -0,0 +1,241 @@
+"""
+ICMP echo packet helpers shared by the ping backends of check_ip_alive.py.
+"""
+
+import functools
+import ipaddress
+import platform
+import socket
+import struct
+from typing import Optional, Tuple, Union
+
+
+# ICMP message types for echo request/reply
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMPV6_ECHO_REQUEST = 128
+ICMPV6_ECHO_REPLY = 129
+
+# Same 56-byte payload size as the system ping utility
+ICMP_PAYLOAD = bytes(range(56))
+
+# Receive buffer for ICMP sockets: replies to thousands of in-flight
+# requests arrive in bursts far larger than the default buffer
+RECV_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Linux socket option stamping every received packet with its kernel
+# arrival time (CLOCK_REALTIME); the socket module does not export it
+SO_TIMESTAMPNS = getattr(socket, "SO_TIMESTAMPNS", 35)
+# struct timespec, as carried by the SCM_TIMESTAMPNS control message
+TIMESPEC = struct.Struct("@ll")
+
+
+def icmp_checksum(data: bytes) -> int:
+    """
+    Compute the Internet checksum (RFC 1071) of an ICMP message.
+    
+    Args:
+        data: ICMP header and payload with the checksum field zeroed
+        
+    Returns:
+        16-bit one's complement checksum
+    """
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+@functools.lru_cache(maxsize=None)
+def _echo_template(family: int, ident: int, payload: bytes) -> Tuple[bytes, int]:
+    """Return an echo request with sequence number 0, and its checksum, built once."""
+    icmp_type = ICMP_ECHO_REQUEST if family == socket.AF_INET else ICMPV6_ECHO_REQUEST
+    header = struct.pack("!BBHHH", icmp_type, 0, 0, ident, 0)
+    checksum = icmp_checksum(header + payload)
+    return (struct.pack("!BBHHH", icmp_type, 0, checksum, ident, 0) + payload, checksum)
+
+
+def build_echo_request(family: int, ident: int, seq: int, payload: bytes = ICMP_PAYLOAD,
+                       tag: Optional[int] = None) -> bytes:
+    """
+    Build an ICMP (or ICMPv6) echo request packet.
+    
+    Only the sequence number (and tag) change between requests, so the
+    packet is patched from a cached template and its checksum updated
+    incrementally (RFC 1624) instead of summing the payload again.
+    
+    Args:
+        family: socket.AF_INET or socket.AF_INET6
+        ident: Echo identifier
+        seq: Echo sequence number
+        payload: Echo payload, at least 4 bytes long when a tag is given
+        tag: 32-bit value written over the first four payload bytes; the
+             reply echoes it back (see parse_echo_reply)
+        
+    Returns:
+        The packed ICMP message, ready for sendto()
+    """
+    template, checksum = _echo_template(family, ident, payload)
+    # HC' = ~(~HC + ~m + m') with the template's m = 0, whose complement
+    # (0xFFFF) is a one's complement zero
+    total = (~checksum & 0xFFFF) + seq
+    data = template[8:]
+    if tag is not None:
+        old_high, old_low = struct.unpack_from("!HH", data)
+        total += (~old_high & 0xFFFF) + (~old_low & 0xFFFF) + (tag >> 16) + (tag & 0xFFFF)
+        data = struct.pack("!I", tag) + data[4:]
+    total = (total & 0xFFFF) + (total >> 16)
+    total = (total & 0xFFFF) + (total >> 16)
+    return template[:2] + struct.pack("!HHH", ~total & 0xFFFF, ident, seq) + data
+
+
+def parse_echo_reply(packet: bytes, family: int, raw: bool) -> Optional[Tuple[int, int, Optional[int]]]:
+    """
+    Extract (ident, seq, tag) from an ICMP echo reply.
+    
+    Args:
+        packet: Data returned by recvfrom()
+        family: socket.AF_INET or socket.AF_INET6
+        raw: Whether the packet came from a SOCK_RAW socket (IPv4 raw sockets
+             deliver the IP header as well)
+        
+    Returns:
+        Tuple of (ident, seq, tag), where tag is the first four payload
+        bytes as set by build_echo_request (None if the payload is shorter),
+        or None if the packet is not an echo reply
+    """
+    if family == socket.AF_INET and raw and packet:
+        packet = packet[(packet[0] & 0x0F) * 4:]
+    if len(packet) < 8:
+        return None
+    icmp_type, _, _, ident, seq = struct.unpack("!BBHHH", packet[:8])
+    if icmp_type != (ICMP_ECHO_REPLY if family == socket.AF_INET else ICMPV6_ECHO_REPLY):
+        return None
+    tag = struct.unpack_from("!I", packet, 8)[0] if len(packet) >= 12 else None
+    return (ident, seq, tag)
+
+
+def open_icmp_socket(family: int) -> Tuple[socket.socket, bool]:
+    """
+    Open an ICMP socket for the given address family.
+    
+    Linux allows unprivileged ICMP through SOCK_DGRAM (subject to
+    net.ipv4.ping_group_range); everywhere else, and as a fallback on Linux,
+    a privileged SOCK_RAW socket is used.
+    
+    Args:
+        family: socket.AF_INET or socket.AF_INET6
+        
+    Returns:
+        Tuple of (socket, is_raw)
+        
+    Raises:
+        OSError: If no ICMP socket could be opened
+    """
+    proto = socket.IPPROTO_ICMP if family == socket.AF_INET else socket.IPPROTO_ICMPV6
+    if platform.system().lower() == "linux":
+        sock_types = (socket.SOCK_DGRAM, socket.SOCK_RAW)
+    else:
+        sock_types = (socket.SOCK_RAW,)
+    
+    error = None
+    for sock_type in sock_types:
+        try:
+            sock = socket.socket(family, sock_type, proto)
+        except OSError as e:
+            error = e
+            continue
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_BYTES)
+        return (sock, sock_type == socket.SOCK_RAW)
+    raise error
+
+
+def enable_receive_timestamps(sock: socket.socket) -> bool:
+    """
+    Ask the kernel to timestamp every packet received on a socket.
+    
+    Args:
+        sock: The socket to configure
+        
+    Returns:
+        True if enabled (Linux only); read the timestamps with recv_timestamped()
+    """
+    if platform.system().lower() != "linux":
+        return False
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+    except OSError:
+        return False
+    return True
+
+
+def recv_timestamped(sock: socket.socket, bufsize: int) -> Tuple[bytes, tuple, Optional[int]]:
+    """
+    Receive a packet together with its sender and kernel arrival time.
+    
+    Args:
+        sock: Socket set up with enable_receive_timestamps()
+        bufsize: Maximum packet size
+        
+    Returns:
+        Tuple of (packet, sender address as returned by recvfrom(), arrival
+        time in nanoseconds since the epoch or None if the kernel attached
+        no timestamp)
+    """
+    packet, ancdata, _, address = sock.recvmsg(bufsize, socket.CMSG_SPACE(TIMESPEC.size))
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPNS and len(data) >= TIMESPEC.size:
+            seconds, nanoseconds = TIMESPEC.unpack_from(data)
+            return (packet, address, seconds * 1_000_000_000 + nanoseconds)
+    return (packet, address, None)
+
+
+def parse_ipv4(ip_address: str) -> Optional[int]:
+    """Return a dotted-quad IPv4 address as an integer, or None for anything else."""
+    try:
+        return struct.unpack("!I", socket.inet_pton(socket.AF_INET, ip_address))[0]
+    except OSError:
+        return None
+
+
+def format_ip(ip_address: Union[int, str]) -> str:
+    """Return the string form of a target; IPv4 integers become dotted quads."""
+    if isinstance(ip_address, str):
+        return ip_address
+    return socket.inet_ntoa(struct.pack("!I", ip_address))
+
+
+def echo_destination(ip_address: Union[int, str], family: int) -> tuple:
+    """
+    Resolve a target to the socket address its echo requests are sent to.
+    
+    Replies come back from this address, so its host part (item 0, in the
+    same form recvfrom() reports) is what replies are matched against.
+    
+    Args:
+        ip_address: IPv4 address as an integer, or IP address or hostname
+        family: socket.AF_INET or socket.AF_INET6
+        
+    Returns:
+        Socket address tuple for sendto()
+        
+    Raises:
+        OSError: If a hostname cannot be resolved
+    """
+    if not isinstance(ip_address, str) or parse_ipv4(ip_address) is not None:
+        return (format_ip(ip_address), 0)
+    return socket.getaddrinfo(ip_address, 0, family)[0][4]
+
+
+def address_family(ip_address: Union[int, str]) -> int:
+    """Return the socket address family for an IP address (hostnames use IPv4)."""
+    if not isinstance(ip_address, str):
+        return socket.AF_INET
+    try:
+        if ipaddress.ip_address(ip_address).version == 6:
+            return socket.AF_INET6
+    except ValueError:
+        pass
+    return socket.AF_INET
@@ -0,0 +1,258 @@
+"""
+io_uring ICMP prober for large scans on Linux.
+
+Echo requests are queued as sendto SQEs and submitted in batches, so a whole
+batch costs a single io_uring_enter() instead of one syscall per packet.
+A pool of recv SQEs stays armed on the same socket and completions are
+harvested straight from the CQ ring, which only needs a syscall when there
+is nothing to reap and the prober has to sleep.
+
+Plain recv completions do not report the sender, so every request carries
+its destination address as the payload tag (see build_echo_request) and a
+reply only counts if it echoes the tag of the host holding its seq.
+
+Requires the optional `liburing` package and Linux 6.0+, the first kernel
+whose send operation honours a destination address (io_uring_prep_sendto);
+check_ip_alive.py falls back to its asyncio prober when either is missing.
+"""
+
+import collections
+import ipaddress
+import os
+import platform
+import socket
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from _icmp import build_echo_request, format_ip, open_icmp_socket, parse_echo_reply, parse_ipv4
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+RING_ENTRIES = 4096
+SUBMIT_BATCH = 512
+RECV_DEPTH = 512
+RECV_BUFFER_SIZE = 2048
+# Outstanding echo requests; keeps completions within the CQ ring and well
+# below the 16-bit sequence space
+MAX_IN_FLIGHT = RING_ENTRIES
+
+# Tag bit separating recv completions from sendto completions in user_data
+RECV_TAG = 1 << 32
+
+
+def available() -> bool:
+    """
+    Check whether the io_uring prober can be used.
+    
+    Returns:
+        True if liburing is installed and the kernel is Linux 6.0 or newer
+    """
+    if liburing is None or platform.system().lower() != "linux":
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split(".")[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (6, 0)
+
+
+def accepts(ip_addresses: Sequence[Union[int, str]]) -> bool:
+    """
+    Check whether every target is an IPv4 address the prober can address.
+    
+    Args:
+        ip_addresses: IPv4 addresses as integers, or IP addresses as strings
+        
+    Returns:
+        True if no address is a hostname or IPv6 address
+    """
+    try:
+        for ip in ip_addresses:
+            if isinstance(ip, str):
+                ipaddress.IPv4Address(ip)
+    except ValueError:
+        return False
+    return True
+
+
+def _address_int(ip_address: Union[int, str]) -> int:
+    """Return an IPv4 address (integer or dotted quad) as a Python int."""
+    return parse_ipv4(ip_address) if isinstance(ip_address, str) else int(ip_address)
+
+
+class UringProber:
+    """
+    Ping many IPv4 addresses through one ICMP socket driven by io_uring.
+    
+    Raises:
+        OSError: If the ICMP socket or the ring cannot be set up
+    """
+    
+    def __init__(self):
+        self.sock, self.raw = open_icmp_socket(socket.AF_INET)
+        self.ident = os.getpid() & 0xFFFF
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        try:
+            liburing.io_uring_queue_init(RING_ENTRIES, self.ring)
+        except OSError:
+            # io_uring missing or blocked (e.g. by seccomp)
+            self.sock.close()
+            raise
+        self._buffers = [bytearray(RECV_BUFFER_SIZE) for _ in range(RECV_DEPTH)]
+        # Packets and addresses must outlive their SQEs until completion
+        self._send_refs: Dict[int, Tuple[bytes, object]] = {}
+        self._queued = 0
+        for index in range(RECV_DEPTH):
+            self._queue_recv(index)
+    
+    def _queue_recv(self, index: int):
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_recv(sqe, self.sock.fileno(), self._buffers[index])
+        liburing.io_uring_sqe_set_data64(sqe, RECV_TAG | index)
+        self._queued += 1
+    
+    def _queue_send(self, ip_address: Union[int, str], seq: int):
+        destination = _address_int(ip_address)
+        packet = build_echo_request(socket.AF_INET, self.ident, seq, tag=destination)
+        address = liburing.Sockaddr(liburing.AF_INET, format_ip(destination), 0)
+        self._send_refs[seq] = (packet, address)
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_sendto(sqe, self.sock.fileno(), packet, address)
+        liburing.io_uring_sqe_set_data64(sqe, seq)
+        self._queued += 1
+        if self._queued >= SUBMIT_BATCH:
+            self._submit()
+    
+    def _submit(self):
+        if self._queued:
+            liburing.io_uring_submit(self.ring)
+            self._queued = 0
+    
+    def _reap(self, wait: float) -> List[Tuple[int, Optional[str], Optional[int]]]:
+        """
+        Harvest completions, sleeping up to `wait` seconds if none are ready.
+        
+        Returns:
+            List of (seq, error, tag) events: error is None for an echo reply,
+            which carries the tag it echoed, and the failure message for a
+            failed sendto
+        """
+        ready = liburing.io_uring_cq_ready(self.ring)
+        if not ready and wait > 0:
+            try:
+                liburing.io_uring_wait_cqe_timeout(self.ring, self.cqe, liburing.timespec(wait))
+            except (OSError, TimeoutError):
+                pass
+            ready = liburing.io_uring_cq_ready(self.ring)
+        if not ready:
+            return []
+        
+        events = []
+        for _ in range(ready):
+            # Entries are consumed one at a time: indexing past the first
+            # peeked CQE does not wrap around the end of the CQ ring
+            liburing.io_uring_peek_cqe(self.ring, self.cqe)
+            entry = self.cqe[0]
+            user_data = entry.user_data
+            try:
+                res = entry.res
+                error = None
+            except OSError as e:
+                res = 0
+                error = e.strerror
+            if user_data & RECV_TAG:
+                index = user_data & 0xFFFF
+                reply = None
+                if error is None:
+                    reply = parse_echo_reply(bytes(self._buffers[index][:res]), socket.AF_INET, self.raw)
+                if reply is not None and (not self.raw or reply[0] == self.ident):
+                    events.append((reply[1], None, reply[2]))
+                self._queue_recv(index)
+            else:
+                self._send_refs.pop(user_data, None)
+                if error is not None:
+                    events.append((user_data, error, None))
+            liburing.io_uring_cq_advance(self.ring, 1)
+        self._submit()
+        return events
+    
+    def probe(self, ip_addresses: Sequence[Union[int, str]], timeout: int = 3, count: int = 1,
+              on_result: Optional[Callable[[Tuple[Union[int, str], bool, str]], None]] = None) -> List[Tuple[Union[int, str], bool, str]]:
+        """
+        Ping every address, keeping up to MAX_IN_FLIGHT requests outstanding.
+        
+        Args:
+            ip_addresses: IPv4 addresses to check, as integers or strings
+            timeout: Seconds to wait for the reply to each request
+            count: Number of echo requests to send per address
+            on_result: Called with each result as soon as it is known
+        
+        Returns:
+            List of tuples containing (ip_address, is_alive, message), in
+            the order of `ip_addresses`
+        """
+        results: List[Optional[Tuple[Union[int, str], bool, str]]] = [None] * len(ip_addresses)
+        attempts = [0] * len(ip_addresses)
+        queue = collections.deque(range(len(ip_addresses)))
+        in_flight: Dict[int, int] = {}
+        deadlines = collections.deque()
+        next_seq = 0
+        
+        def finish(index: int, is_alive: bool, message: str):
+            ip = ip_addresses[index]
+            # Report packed (NumPy) targets as plain ints
+            result = (ip if isinstance(ip, str) else int(ip), is_alive, message)
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+        
+        while queue or in_flight:
+            while queue and len(in_flight) < MAX_IN_FLIGHT:
+                index = queue.popleft()
+                while next_seq in in_flight:
+                    next_seq = (next_seq + 1) & 0xFFFF
+                seq = next_seq
+                next_seq = (next_seq + 1) & 0xFFFF
+                in_flight[seq] = index
+                attempts[index] += 1
+                deadlines.append((time.monotonic() + timeout, seq, index))
+                self._queue_send(ip_addresses[index], seq)
+            self._submit()
+            
+            wait = max(0.0, deadlines[0][0] - time.monotonic()) if deadlines else 0.0
+            for seq, error, tag in self._reap(min(wait, 0.05)):
+                index = in_flight.get(seq)
+                if index is None:
+                    continue
+                if error is None and tag != _address_int(ip_addresses[index]):
+                    # Late reply from an earlier request with this seq
+                    continue
+                del in_flight[seq]
+                if error is not None:
+                    finish(index, False, f"Error: {error}")
+                else:
+                    finish(index, True, "Alive")
+            
+            now = time.monotonic()
+            while deadlines and deadlines[0][0] <= now:
+                _, seq, index = deadlines.popleft()
+                if in_flight.get(seq) != index:
+                    continue
+                del in_flight[seq]
+                if attempts[index] < count:
+                    queue.append(index)
+                else:
+                    finish(index, False, "Not reachable")
+        
+        return results
+    
+    def close(self):
+        """Tear down the ring (cancelling armed recvs) and close the socket."""
+        liburing.io_uring_queue_exit(self.ring)
+        self.sock.close()
+
@@ -0,0 +1,226 @@
+"""
+Native Windows ICMP echo through iphlpapi.dll (IcmpSendEcho2).
+
+Requests are issued asynchronously, each signalling its own Win32 event,
+and up to 64 of them are awaited at once with WaitForMultipleObjects, so
+no ping.exe process is launched per host. Only IPv4 is supported; callers
+fall back to ping.exe for anything else.
+"""
+
+import ctypes
+import ipaddress
+import socket
+import struct
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+
+ERROR_IO_PENDING = 997
+WAIT_OBJECT_0 = 0x00000000
+IP_SUCCESS = 0
+
+# WaitForMultipleObjects cannot wait on more handles than this
+MAXIMUM_WAIT_OBJECTS = 64
+
+# Same 56-byte payload size as the system ping utility
+REQUEST_DATA = bytes(range(56))
+
+
+class IP_OPTION_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("Ttl", ctypes.c_ubyte),
+        ("Tos", ctypes.c_ubyte),
+        ("Flags", ctypes.c_ubyte),
+        ("OptionsSize", ctypes.c_ubyte),
+        ("OptionsData", ctypes.c_void_p),
+    ]
+
+
+class ICMP_ECHO_REPLY(ctypes.Structure):
+    _fields_ = [
+        ("Address", ctypes.c_ulong),
+        ("Status", ctypes.c_ulong),
+        ("RoundTripTime", ctypes.c_ulong),
+        ("DataSize", ctypes.c_ushort),
+        ("Reserved", ctypes.c_ushort),
+        ("Data", ctypes.c_void_p),
+        ("Options", IP_OPTION_INFORMATION),
+    ]
+
+
+# Room for the reply, the echoed data, an 8-byte ICMP error message and,
+# since requests are asynchronous, an IO_STATUS_BLOCK (two pointers)
+REPLY_SIZE = ctypes.sizeof(ICMP_ECHO_REPLY) + len(REQUEST_DATA) + 8 + 2 * ctypes.sizeof(ctypes.c_void_p)
+
+_iphlpapi = None
+_kernel32 = None
+_icmp_handle = None
+
+if sys.platform == "win32":
+    # ctypes.wintypes fails to import off Windows on Python 3.7
+    from ctypes import wintypes
+    
+    try:
+        _iphlpapi = ctypes.WinDLL("iphlpapi.dll", use_last_error=True)
+        _kernel32 = ctypes.WinDLL("kernel32.dll", use_last_error=True)
+        
+        _iphlpapi.IcmpCreateFile.restype = wintypes.HANDLE
+        _iphlpapi.IcmpCreateFile.argtypes = []
+        _iphlpapi.IcmpSendEcho2.restype = wintypes.DWORD
+        _iphlpapi.IcmpSendEcho2.argtypes = [
+            wintypes.HANDLE, wintypes.HANDLE, ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_ulong, ctypes.c_void_p, wintypes.WORD, ctypes.c_void_p,
+            ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD,
+        ]
+        _iphlpapi.IcmpParseReplies.restype = wintypes.DWORD
+        _iphlpapi.IcmpParseReplies.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+        
+        _kernel32.CreateEventW.restype = wintypes.HANDLE
+        _kernel32.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        _kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        _kernel32.WaitForMultipleObjects.argtypes = [
+            wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD,
+        ]
+        _kernel32.CloseHandle.restype = wintypes.BOOL
+        _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        
+        handle = _iphlpapi.IcmpCreateFile()
+        if handle and handle != wintypes.HANDLE(-1).value:
+            _icmp_handle = handle
+    except (OSError, AttributeError):
+        _icmp_handle = None
+
+# Reply buffers and events of requests still pending when we stopped
+# waiting; the system may still complete them, so they are never freed
+_abandoned = []
+
+
+def available() -> bool:
+    """Check whether the IcmpSendEcho2 API was loaded."""
+    return _icmp_handle is not None
+
+
+def accepts(ip_address: Union[int, str]) -> bool:
+    """Check whether an address is an IPv4 integer or literal this API can ping."""
+    if not isinstance(ip_address, str):
+        return True
+    try:
+        ipaddress.IPv4Address(ip_address)
+    except ValueError:
+        return False
+    return True
+
+
+def _send_batch(ip_addresses: Sequence[Union[int, str]], timeout: int) -> List[bool]:
+    """
+    Ping up to MAXIMUM_WAIT_OBJECTS addresses concurrently, once each.
+    
+    Args:
+        ip_addresses: IPv4 addresses to ping, as integers or strings
+        timeout: Timeout in seconds for the replies
+    
+    Returns:
+        List of booleans, True where an echo reply was received
+    """
+    timeout_ms = timeout * 1000
+    alive = [False] * len(ip_addresses)
+    events = []
+    buffers = []
+    outstanding = []
+    
+    try:
+        for index, ip in enumerate(ip_addresses):
+            event = _kernel32.CreateEventW(None, False, False, None)
+            if not event:
+                raise ctypes.WinError(ctypes.get_last_error())
+            events.append(event)
+            reply = ctypes.create_string_buffer(REPLY_SIZE)
+            buffers.append(reply)
+            packed = socket.inet_aton(ip) if isinstance(ip, str) else struct.pack("!I", ip)
+            destination = struct.unpack("=L", packed)[0]
+            replies = _iphlpapi.IcmpSendEcho2(
+                _icmp_handle, event, None, None, destination,
+                REQUEST_DATA, len(REQUEST_DATA), None,
+                reply, REPLY_SIZE, timeout_ms,
+            )
+            # Asynchronous sends return 0 with ERROR_IO_PENDING; any other
+            # error means the request failed immediately and the event will
+            # never fire. The last error is only meaningful after a 0 return.
+            if replies:
+                # Completed synchronously, the reply is already in the buffer
+                alive[index] = ICMP_ECHO_REPLY.from_buffer(reply).Status == IP_SUCCESS
+            elif ctypes.get_last_error() == ERROR_IO_PENDING:
+                outstanding.append(index)
+        
+        # Requests time out on their own after timeout_ms, the extra second
+        # only guards against the event never being signalled
+        deadline = time.monotonic() + timeout + 1
+        while outstanding:
+            remaining_ms = int(max(0.0, deadline - time.monotonic()) * 1000)
+            handles = (wintypes.HANDLE * len(outstanding))(*(events[i] for i in outstanding))
+            signalled = _kernel32.WaitForMultipleObjects(len(outstanding), handles, False, remaining_ms)
+            if not WAIT_OBJECT_0 <= signalled < WAIT_OBJECT_0 + len(outstanding):
+                break
+            index = outstanding.pop(signalled - WAIT_OBJECT_0)
+            if _iphlpapi.IcmpParseReplies(buffers[index], REPLY_SIZE):
+                alive[index] = ICMP_ECHO_REPLY.from_buffer(buffers[index]).Status == IP_SUCCESS
+    finally:
+        for index, event in enumerate(events):
+            if index in outstanding:
+                _abandoned.append((buffers[index], event))
+            else:
+                _kernel32.CloseHandle(event)
+    
+    return alive
+
+
+def probe(ip_addresses: Sequence[Union[int, str]], timeout: int = 3, count: int = 1,
+          on_result: Optional[Callable[[Tuple[Union[int, str], bool, str]], None]] = None) -> List[Tuple[Union[int, str], bool, str]]:
+    """
+    Ping IPv4 addresses in batches of MAXIMUM_WAIT_OBJECTS.
+    
+    Args:
+        ip_addresses: IPv4 addresses to check, as integers or strings
+        timeout: Timeout in seconds for each ping
+        count: Number of ping packets to send
+        on_result: Called with each result as soon as it is known
+    
+    Returns:
+        List of tuples containing (ip_address, is_alive, message)
+    """
+    results = []
+    for start in range(0, len(ip_addresses), MAXIMUM_WAIT_OBJECTS):
+        # Report packed (NumPy) targets as plain ints
+        batch = [ip if isinstance(ip, str) else int(ip)
+                 for ip in ip_addresses[start:start + MAXIMUM_WAIT_OBJECTS]]
+        alive = [False] * len(batch)
+        for _ in range(count):
+            pending = [i for i, is_alive in enumerate(alive) if not is_alive]
+            if not pending:
+                break
+            replies = _send_batch([batch[i] for i in pending], timeout)
+            for i, is_alive in zip(pending, replies):
+                alive[i] = is_alive
+        
+        for ip, is_alive in zip(batch, alive):
+            result = (ip, True, "Alive") if is_alive else (ip, False, "Not reachable")
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def ping(ip_address: Union[int, str], timeout: int = 3, count: int = 1) -> bool:
+    """
+    Ping a single IPv4 address.
+    
+    Args:
+        ip_address: The IPv4 address to ping, as an integer or string
+        timeout: Timeout in seconds for each ping
+        count: Number of ping packets to send
+    
+    Returns:
+        True if the host replied
+    """
+    return probe([ip_address], timeout, count)[0][1]
@@ -18,69 +18,661 @@ Usage:
 import subprocess
 import sys
 import argparse
+import array
+import asyncio
+import collections
 import concurrent.futures
+import functools
+import heapq
 import time
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 import platform
 import signal
 from datetime import datetime
 import itertools
 import ipaddress
+import os
+import socket
+import threading
 
+from _icmp import (address_family, build_echo_request, echo_destination, enable_receive_timestamps, format_ip,
+                   open_icmp_socket, parse_echo_reply, parse_ipv4, recv_timestamped)
+import _uring_prober
+import _windows_icmp
 
-def ping_ip(ip_address: str, timeout: int = 3, count: int = 1, show_progress: bool = False) -> Tuple[str, bool, str]:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# A ping target: IPv4 addresses are kept as integers and only formatted for
+# sendto() and display; hostnames and IPv6 addresses stay strings
+Target = Union[int, str]
+
+
+class PingSocket:
     """
-    Ping an IP address to check if it's alive.
+    A single ICMP socket shared by every destination of one address family.
+    
+    Echo requests from all callers go out through the same socket; a daemon
+    reader thread receives the replies and resolves the future registered
+    for each (ident, seq) pair, so no socket or process is created per host.
+    A reply only counts if it comes from the address the request was sent
+    to, so a late reply cannot answer a later request reusing its seq.
+    """
+    
+    def __init__(self, family: int):
+        self.family = family
+        self.sock, self.raw = open_icmp_socket(family)
+        # SOCK_DGRAM sockets get their identifier rewritten by the kernel,
+        # which also filters replies per socket, so only raw sockets need it.
+        self.ident = os.getpid() & 0xFFFF
+        self._seq = itertools.count()
+        self._pending: Dict[Tuple[int, int], Tuple[concurrent.futures.Future, str]] = {}
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+    
+    def ping(self, ip_address: str, timeout: int = 3, count: int = 1) -> bool:
+        """
+        Send up to `count` echo requests and wait for a reply.
+        
+        Args:
+            ip_address: The IP address to ping
+            timeout: Seconds to wait for the reply to each request
+            count: Number of echo requests to send
+            
+        Returns:
+            True as soon as any echo reply arrives, False otherwise
+        """
+        destination = echo_destination(ip_address, self.family)
+        for _ in range(count):
+            future = concurrent.futures.Future()
+            with self._lock:
+                seq = next(self._seq) & 0xFFFF
+                key = (self.ident, seq)
+                self._pending[key] = (future, destination[0])
+            try:
+                self.sock.sendto(build_echo_request(self.family, self.ident, seq), destination)
+                future.result(timeout=timeout)
+                return True
+            except concurrent.futures.TimeoutError:
+                continue
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+        return False
+    
+    def _read_loop(self):
+        """Receive echo replies and dispatch them to the waiting futures."""
+        while True:
+            try:
+                packet, address = self.sock.recvfrom(2048)
+            except OSError:
+                continue
+            reply = parse_echo_reply(packet, self.family, self.raw)
+            if reply is None:
+                continue
+            ident, seq, _ = reply
+            if not self.raw:
+                ident = self.ident
+            with self._lock:
+                pending = self._pending.get((ident, seq))
+                if pending is None or pending[1] != address[0]:
+                    continue
+                del self._pending[(ident, seq)]
+            future = pending[0]
+            if not future.done():
+                future.set_result(True)
+
+
+# Operating system, detected once at import
+IS_WINDOWS = platform.system().lower() == "windows"
+
+# ANSI color codes and the pre-colored status cells built from them
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+RESET = "\033[0m"
+PROGRESS_ALIVE = f"{GREEN}✓{RESET}"
+PROGRESS_DEAD = f"{RED}✗{RESET}"
+STATUS_ALIVE = f"{GREEN}{'✓ ALIVE':<10}{RESET}"
+STATUS_DEAD = f"{RED}{'✗ DEAD':<10}{RESET}"
+
+# Progress lines are written in batches of this many, or with the first
+# result that arrives a second or more after the last write
+PROGRESS_FLUSH_LINES = 64
+PROGRESS_FLUSH_INTERVAL = 1.0
+
+# Echo requests kept in flight by the asyncio prober
+MAX_ICMP_IN_FLIGHT = 4096
+
+# Smallest result set worth formatting with the optional Numba kernel;
+# below it importing Numba and loading the compiled kernel costs more
+# than the kernel saves
+COMPILED_FORMAT_MIN = 1 << 21
+
+# Upper bound on addresses per worker task in the ping utility fallback,
+# keeping progress output and the pending window responsive
+MAX_CHUNK_SIZE = 64
+
+# Hard ceiling on concurrent ping workers: far more ping processes than
+# CPUs only adds contention and lowers throughput
+MAX_WORKERS_CEILING = max(16, (os.cpu_count() or 1) * 2)
+
+
+# Smallest number of echo requests kept in flight by round robin checks
+MIN_IN_FLIGHT = 8
+
+# Round robin slow start: the window is multiplied by WINDOW_GROWTH after
+# each round whose reply rate beat the best so far by MIN_RATE_GAIN; the
+# first round that does not steps back to the previous window for good
+WINDOW_GROWTH = 2
+MIN_RATE_GAIN = 1.25
+
+# Results kept per address for the round robin uptime statistics
+HISTORY_LENGTH = 10
+
+# Timestamp shown with each round robin check
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# Extra time a ping utility child gets beyond its own timeout before it is
+# killed, and how soon a SIGALRM that found the deadline heap busy retries
+SUBPROCESS_GRACE = 5
+ALARM_RETRY_INTERVAL = 0.01
+
+
+# One shared PingSocket per address family; None once opening has failed
+_ping_sockets: Dict[int, Optional[PingSocket]] = {}
+_ping_sockets_lock = threading.Lock()
+
+
+def _get_ping_socket(ip_address: str) -> Optional[PingSocket]:
+    """
+    Return the shared PingSocket for the address family of `ip_address`.
+    
+    Args:
+        ip_address: The IP address about to be pinged
+        
+    Returns:
+        The PingSocket, or None if ICMP sockets are not permitted
+    """
+    family = address_family(ip_address)
+    with _ping_sockets_lock:
+        if family not in _ping_sockets:
+            try:
+                _ping_sockets[family] = PingSocket(family)
+            except OSError:
+                _ping_sockets[family] = None
+        return _ping_sockets[family]
+
+
+class IcmpProber:
+    """
+    Asyncio ICMP prober pumping non-blocking ICMP sockets from the event loop.
+    
+    Every destination shares one socket per address family, registered with
+    loop.add_reader(); each in-flight echo request waits on an asyncio.Future
+    keyed by its sequence number, so thousands of probes run on one thread;
+    a reply must also come from the request's destination to resolve it.
+    Futures resolve to the round-trip time of their reply, taken from the
+    kernel's receive timestamp (SO_TIMESTAMPNS) where available so event
+    loop latency does not inflate it.
+    Must be created from within a running event loop.
+    
+    Raises:
+        OSError: If no IPv4 ICMP socket could be opened
+        NotImplementedError: If the event loop cannot watch sockets (proactor)
+    """
+    
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self.ident = os.getpid() & 0xFFFF
+        self._seq = itertools.count()
+        self._pending: Dict[int, Tuple[asyncio.Future, int, str]] = {}
+        self._sockets: Dict[int, Tuple[socket.socket, bool, bool]] = {}
+        self._socket(socket.AF_INET)
+    
+    def _socket(self, family: int) -> Tuple[socket.socket, bool, bool]:
+        """Return (socket, is_raw, is_timestamped) for a family, opening it on first use."""
+        if family not in self._sockets:
+            sock, raw = open_icmp_socket(family)
+            sock.setblocking(False)
+            timestamped = enable_receive_timestamps(sock)
+            try:
+                self._loop.add_reader(sock.fileno(), self._on_read, family)
+            except NotImplementedError:
+                # Proactor event loops (the Windows default) have no add_reader()
+                sock.close()
+                raise
+            self._sockets[family] = (sock, raw, timestamped)
+        return self._sockets[family]
+    
+    def _next_seq(self) -> int:
+        """
+        Allocate a 16-bit sequence number that is not currently in flight.
+        
+        Raises:
+            OSError: If all 65536 sequence numbers are in flight
+        """
+        if len(self._pending) > 0xFFFF:
+            raise OSError("All 65536 ICMP sequence numbers are in flight")
+        while True:
+            seq = next(self._seq) & 0xFFFF
+            if seq not in self._pending:
+                return seq
+    
+    async def ping_rtt(self, ip_address: Target, timeout: int = 3, count: int = 1) -> Optional[float]:
+        """
+        Ping an IP address over the shared socket and measure the round trip.
+        
+        Args:
+            ip_address: The IP address to ping, IPv4 as an integer or string
+            timeout: Seconds to wait for the reply to each request
+            count: Number of echo requests to send
+            
+        Returns:
+            Round-trip time in seconds of the first reply, or None if no
+            reply arrived
+            
+        Raises:
+            OSError: If the address cannot be resolved or the echo request
+                     cannot be sent
+        """
+        family = address_family(ip_address)
+        destination = echo_destination(ip_address, family)
+        sock, _, timestamped = self._socket(family)
+        for _ in range(count):
+            seq = self._next_seq()
+            future = self._loop.create_future()
+            # Kernel timestamps are wall clock, so match them when sending
+            sent_at = time.time_ns() if timestamped else time.perf_counter_ns()
+            self._pending[seq] = (future, sent_at, destination[0])
+            try:
+                packet = build_echo_request(family, self.ident, seq)
+                while True:
+                    try:
+                        sock.sendto(packet, destination)
+                        break
+                    except BlockingIOError:
+                        # Socket send buffer is full; let replies drain
+                        await asyncio.sleep(0.001)
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                continue
+            finally:
+                self._pending.pop(seq, None)
+        return None
+    
+    async def ping(self, ip_address: Target, timeout: int = 3, count: int = 1) -> Tuple[Target, bool, str]:
+        """
+        Ping an IP address over the shared socket.
+        
+        Args:
+            ip_address: The IP address to ping, IPv4 as an integer or string
+            timeout: Seconds to wait for the reply to each request
+            count: Number of echo requests to send
+            
+        Returns:
+            Tuple of (ip_address, is_alive, message)
+        """
+        try:
+            if await self.ping_rtt(ip_address, timeout, count) is not None:
+                return (ip_address, True, "Alive")
+            return (ip_address, False, "Not reachable")
+        except Exception as e:
+            return (ip_address, False, f"Error: {str(e)}")
+    
+    def _on_read(self, family: int):
+        """Drain the socket and resolve the futures of the replies received."""
+        sock, raw, timestamped = self._sockets[family]
+        while True:
+            try:
+                if timestamped:
+                    packet, address, received_at = recv_timestamped(sock, 2048)
+                else:
+                    packet, address = sock.recvfrom(2048)
+                    received_at = None
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                continue
+            reply = parse_echo_reply(packet, family, raw)
+            if reply is None:
+                continue
+            ident, seq, _ = reply
+            if raw and ident != self.ident:
+                continue
+            pending = self._pending.get(seq)
+            if pending is None or pending[2] != address[0]:
+                # Unknown seq, or a late reply from an earlier request that
+                # used the same seq for another host
+                continue
+            del self._pending[seq]
+            if not pending[0].done():
+                future, sent_at, _ = pending
+                if received_at is None:
+                    received_at = time.time_ns() if timestamped else time.perf_counter_ns()
+                # Clamped in case the wall clock stepped back in between
+                future.set_result(max(0, received_at - sent_at) / 1e9)
+    
+    def close(self):
+        """Unregister and close all sockets."""
+        for sock, _, _ in self._sockets.values():
+            self._loop.remove_reader(sock.fileno())
+            sock.close()
+        self._sockets.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _ping_arguments(timeout: int, count: int) -> Tuple[str, ...]:
+    """Return the ping command line without the target, built once per (timeout, count)."""
+    # Determine ping command based on operating system
+    if IS_WINDOWS:
+        # Windows ping command
+        return ("ping", "-n", str(count), "-w", str(timeout * 1000))
+    else:
+        # Unix/Linux/macOS ping command
+        return ("ping", "-c", str(count), "-W", str(timeout))
+
+
+def _ping_command(ip_address: str, timeout: int = 3, count: int = 1) -> List[str]:
+    """
+    Build the system ping command line for the current operating system.
     
     Args:
         ip_address: The IP address to ping
         timeout: Timeout in seconds for each ping
         count: Number of ping packets to send
+        
+    Returns:
+        Command line as an argument list
+    """
+    return [*_ping_arguments(timeout, count), ip_address]
+
+
+# Running ping utility children as a heap of (deadline, pid), and whether
+# the SIGALRM handler killing overdue ones is installed in this process
+_child_deadlines: List[Tuple[float, int]] = []
+_child_deadlines_lock = threading.Lock()
+_child_reaper_installed = False
+
+
+def _arm_child_alarm():
+    """Point the interval timer at the nearest child deadline. Call with the lock held."""
+    if _child_deadlines:
+        delay = max(_child_deadlines[0][0] - time.monotonic(), 0.001)
+        signal.setitimer(signal.ITIMER_REAL, delay)
+    else:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _on_child_alarm(signum, frame):
+    """SIGALRM handler: kill the process group of every overdue ping child."""
+    # The handler runs on the main thread, possibly interrupting code that
+    # holds the lock; never block on it, just try again shortly
+    if not _child_deadlines_lock.acquire(blocking=False):
+        signal.setitimer(signal.ITIMER_REAL, ALARM_RETRY_INTERVAL)
+        return
+    try:
+        now = time.monotonic()
+        while _child_deadlines and _child_deadlines[0][0] <= now:
+            _, pid = heapq.heappop(_child_deadlines)
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                # Already exited
+                pass
+        _arm_child_alarm()
+    finally:
+        _child_deadlines_lock.release()
+
+
+def _install_child_reaper() -> bool:
+    """
+    Install the SIGALRM handler enforcing ping utility timeouts.
+    
+    Signal handlers can only be installed from the main thread, so this is
+    a no-op elsewhere; pools call it up front for their worker threads.
+    
+    Returns:
+        True if the handler is installed in this process
+    """
+    global _child_reaper_installed
+    if not _child_reaper_installed and not IS_WINDOWS and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGALRM, _on_child_alarm)
+        _child_reaper_installed = True
+    return _child_reaper_installed
+
+
+def _ping_subprocess(ip_address: str, timeout: int = 3, count: int = 1) -> bool:
+    """
+    Ping an IP address with the system ping utility.
+    
+    Used when ICMP sockets cannot be opened (no privileges). Each child runs
+    in its own session and registers its deadline with the shared SIGALRM
+    handler, which kills the whole group if ping hangs; the caller simply
+    blocks in wait() instead of polling for a per-call timeout.
+    
+    Args:
+        ip_address: The IP address to ping
+        timeout: Timeout in seconds for each ping
+        count: Number of ping packets to send
+        
+    Returns:
+        True if the host replied
+        
+    Raises:
+        subprocess.TimeoutExpired: If ping itself hangs
+    """
+    command = _ping_command(ip_address, timeout, count)
+    if not _install_child_reaper():
+        # No SIGALRM here (Windows, or a thread started before the handler
+        # was installed): let subprocess enforce the timeout
+        result = subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout + SUBPROCESS_GRACE
+        )
+        return result.returncode == 0
+    
+    # Execute ping command
+    proc = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    entry = (time.monotonic() + timeout + SUBPROCESS_GRACE, proc.pid)
+    with _child_deadlines_lock:
+        heapq.heappush(_child_deadlines, entry)
+        if _child_deadlines[0] is entry:
+            _arm_child_alarm()
+    
+    try:
+        returncode = proc.wait()
+    finally:
+        with _child_deadlines_lock:
+            if entry in _child_deadlines:
+                _child_deadlines.remove(entry)
+                heapq.heapify(_child_deadlines)
+                _arm_child_alarm()
+    
+    if returncode == -signal.SIGKILL:
+        raise subprocess.TimeoutExpired(command, timeout + SUBPROCESS_GRACE)
+    return returncode == 0
+
+
+def ping_ip(ip_address: Target, timeout: int = 3, count: int = 1, show_progress: bool = False) -> Tuple[Target, bool, str]:
+    """
+    Ping an IP address to check if it's alive.
+    
+    Args:
+        ip_address: The IP address to ping, IPv4 as an integer or string
+        timeout: Timeout in seconds for each ping
+        count: Number of ping packets to send
         show_progress: Whether to show real-time ping progress
         
     Returns:
         Tuple of (ip_address, is_alive, message)
     """
     try:
+        address = format_ip(ip_address)
         if show_progress:
-            print(f"  🔍 Pinging {ip_address}...", end=" ", flush=True)
+            print(f"  🔍 Pinging {address}...", end=" ", flush=True)
         
-        # Determine ping command based on operating system
-        if platform.system().lower() == "windows":
-            # Windows ping command
-            cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), ip_address]
+        # Use the native ICMP API on Windows or the shared ICMP socket,
+        # falling back to the ping utility
+        if _windows_icmp.available() and _windows_icmp.accepts(ip_address):
+            is_alive = _windows_icmp.ping(ip_address, timeout, count)
         else:
-            # Unix/Linux/macOS ping command
-            cmd = ["ping", "-c", str(count), "-W", str(timeout), ip_address]
-        
-        # Execute ping command
-        result = subprocess.run(
-            cmd, 
-            capture_output=True, 
-            text=True, 
-            timeout=timeout + 5  # Extra buffer for subprocess timeout
-        )
+            ping_socket = _get_ping_socket(address)
+            if ping_socket is not None:
+                is_alive = ping_socket.ping(address, timeout, count)
+            else:
+                is_alive = _ping_subprocess(address, timeout, count)
         
-        if result.returncode == 0:
+        if is_alive:
             if show_progress:
-                print("\033[92m✓\033[0m")  # Green checkmark
+                print(PROGRESS_ALIVE)  # Green checkmark
             return (ip_address, True, "Alive")
         else:
             if show_progress:
-                print("\033[91m✗\033[0m")  # Red X
+                print(PROGRESS_DEAD)  # Red X
             return (ip_address, False, "Not reachable")
             
     except subprocess.TimeoutExpired:
         if show_progress:
-            print("\033[93m⏱\033[0m")  # Yellow timeout symbol
+            print(f"{YELLOW}⏱{RESET}")  # Yellow timeout symbol
         return (ip_address, False, "Timeout")
     except Exception as e:
         if show_progress:
-            print("\033[91m❌\033[0m")  # Red error
+            print(f"{RED}❌{RESET}")  # Red error
         return (ip_address, False, f"Error: {str(e)}")
 
 
-def expand_ip_range(ip_range: str) -> List[str]:
+def _ip_block(start: int, end: int) -> Sequence[int]:
+    """
+    Pack every IPv4 address from `start` to `end` (inclusive) as uint32.
+    
+    Args:
+        start: First address as an integer
+        end: Last address as an integer
+        
+    Returns:
+        NumPy uint32 array when NumPy is installed, otherwise array('I')
+    """
+    if np is not None:
+        return np.arange(start, end + 1, dtype=np.uint32)
+    return array.array("I", range(start, end + 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_ipv4_formatter() -> Optional[Callable]:
+    """Compile the Numba bulk IPv4 formatter on first use; None without Numba."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(cache=True, parallel=True)
+    def format_rows(ip_addresses, out):
+        # Each row receives one address as zero-padded dotted-quad ASCII
+        for i in numba.prange(ip_addresses.size):
+            value = np.int64(ip_addresses[i])
+            pos = 0
+            for shift in (24, 16, 8, 0):
+                octet = (value >> shift) & 0xFF
+                if octet >= 100:
+                    out[i, pos] = 48 + octet // 100
+                    pos += 1
+                if octet >= 10:
+                    out[i, pos] = 48 + octet // 10 % 10
+                    pos += 1
+                out[i, pos] = 48 + octet % 10
+                pos += 1
+                if shift:
+                    out[i, pos] = 46
+                    pos += 1
+    
+    return format_rows
+
+
+def _format_ips(ip_addresses: Sequence[Target]) -> List[str]:
+    """
+    Format many targets for display at once.
+    
+    With NumPy, all-IPv4 targets are split into octets with vectorized
+    operations, or handed to a compiled, parallel Numba kernel when Numba is
+    installed and there are at least COMPILED_FORMAT_MIN of them.
+    
+    Args:
+        ip_addresses: IPv4 addresses as integers, or IP addresses as strings
+        
+    Returns:
+        List of addresses as strings, in the same order
+    """
+    if np is None or any(isinstance(ip, str) for ip in ip_addresses):
+        return [format_ip(ip) for ip in ip_addresses]
+    
+    packed = np.asarray(ip_addresses, dtype=np.uint32)
+    format_rows = _compiled_ipv4_formatter() if packed.size >= COMPILED_FORMAT_MIN else None
+    if format_rows is not None:
+        rows = np.zeros((packed.size, 16), dtype=np.uint8)
+        format_rows(packed, rows)
+        return rows.view("S16").ravel().astype(str).tolist()
+    octets = (packed[:, None] >> np.array([24, 16, 8, 0], dtype=np.uint32)) & 0xFF
+    return list(map("{}.{}.{}.{}".format, *octets.T.tolist()))
+
+
+def _ip_range_bounds(ip_range: str) -> Tuple[int, int]:
+    """
+    Parse an IP range into integer bounds.
+    
+    Args:
+        ip_range: CIDR block, start-end range or single IP
+        
+    Returns:
+        Tuple of (first, last) address as integers, inclusive
+        
+    Raises:
+        ValueError: If the range is malformed
+    """
+    # Handle CIDR notation (e.g., 192.168.1.0/24)
+    if '/' in ip_range:
+        # Parsing validates the block; the bounds follow from its base and
+        # size without building any per-host IPv4Address objects
+        network = ipaddress.IPv4Network(ip_range, strict=False)
+        start = int(network.network_address)
+        end = start + network.num_addresses - 1
+        # Same as network.hosts(): skip network and broadcast addresses
+        # except for /31 and /32 networks
+        if network.prefixlen < 31:
+            start += 1
+            end -= 1
+        return (start, end)
+    
+    # Handle range notation (e.g., 192.168.1.1-192.168.1.50)
+    elif '-' in ip_range:
+        start_ip_str, end_ip_str = ip_range.split('-', 1)
+        start_ip = ipaddress.IPv4Address(start_ip_str.strip())
+        end_ip = ipaddress.IPv4Address(end_ip_str.strip())
+        
+        if start_ip > end_ip:
+            raise ValueError(f"Start IP {start_ip} is greater than end IP {end_ip}")
+        
+        return (int(start_ip), int(end_ip))
+    
+    # Handle single IP
+    else:
+        ip = int(ipaddress.IPv4Address(ip_range))
+        return (ip, ip)
+
+
+def expand_ip_range(ip_range: str) -> Sequence[int]:
     """
     Expand IP range into list of individual IP addresses.
     
@@ -93,64 +685,118 @@ def expand_ip_range(ip_range: str) -> List[str]:
         ip_range: IP range string
         
     Returns:
-        List of IP addresses
+        IPv4 addresses as packed uint32 integers (see _ip_block)
     """
     try:
-        # Handle CIDR notation (e.g., 192.168.1.0/24)
-        if '/' in ip_range:
-            network = ipaddress.IPv4Network(ip_range, strict=False)
-            return [str(ip) for ip in network.hosts()]
-        
-        # Handle range notation (e.g., 192.168.1.1-192.168.1.50)
-        elif '-' in ip_range:
-            start_ip_str, end_ip_str = ip_range.split('-', 1)
-            start_ip = ipaddress.IPv4Address(start_ip_str.strip())
-            end_ip = ipaddress.IPv4Address(end_ip_str.strip())
-            
-            if start_ip > end_ip:
-                raise ValueError(f"Start IP {start_ip} is greater than end IP {end_ip}")
-            
-            ips = []
-            current = start_ip
-            while current <= end_ip:
-                ips.append(str(current))
-                current += 1
-            return ips
-        
-        # Handle single IP
-        else:
-            # Validate it's a valid IP
-            ipaddress.IPv4Address(ip_range)
-            return [ip_range]
+        return _ip_block(*_ip_range_bounds(ip_range))
             
     except Exception as e:
         print(f"Error parsing IP range '{ip_range}': {e}")
-        return []
+        return _ip_block(1, 0)
+
+
+def _ip_sort_key(ip_address: Target) -> Tuple[int, Target]:
+    """Sort key ordering IPv4 addresses numerically, then anything else by name."""
+    if isinstance(ip_address, str):
+        value = parse_ipv4(ip_address)
+        if value is None:
+            return (1, ip_address)
+        ip_address = value
+    return (0, ip_address)
+
+
+def _is_packed(ip_addresses: Sequence[Target]) -> bool:
+    """Check whether targets are a packed uint32 array, hence all IPv4."""
+    return isinstance(ip_addresses, array.array) or (np is not None and isinstance(ip_addresses, np.ndarray))
 
 
-def read_ips_from_file(filename: str) -> List[str]:
+def _iter_targets(ip_addresses: Iterable[Target]) -> Iterator[Target]:
     """
-    Read IP addresses from a file.
+    Iterate over targets as Python ints and strings.
+    
+    Packed NumPy arrays are converted a block at a time instead of yielding
+    NumPy scalars or materializing the whole array as a list.
+    """
+    if np is not None and isinstance(ip_addresses, np.ndarray):
+        for start in range(0, len(ip_addresses), 65536):
+            yield from ip_addresses[start:start + 65536].tolist()
+    else:
+        yield from ip_addresses
+
+
+def unique_sorted_ips(*sources: Iterable[Target]) -> Sequence[Target]:
+    """
+    Drop duplicate IP addresses and sort them numerically.
+    
+    IPv4 addresses, whether given as integers or dotted quads, are
+    deduplicated and sorted as packed uint32 integers. Packed sources (see
+    _ip_block) are merged as arrays; only the other sources are walked one
+    target at a time.
     
     Args:
-        filename: Path to file containing IP addresses (one per line)
+        *sources: IP addresses, possibly with duplicates from overlapping
+                  ranges, files and command line arguments
         
     Returns:
-        List of IP addresses
+        The packed IPv4 addresses (see _ip_block) when there is nothing else,
+        otherwise a list of the IPv4 integers followed by the hostnames and
+        IPv6 addresses sorted by name
+    """
+    blocks = []
+    ipv4 = array.array("I")
+    others = {}
+    for source in sources:
+        if _is_packed(source):
+            blocks.append(source)
+            continue
+        for ip in source:
+            if isinstance(ip, str):
+                value = parse_ipv4(ip)
+                if value is None:
+                    others[ip] = None
+                    continue
+                ip = value
+            ipv4.append(ip)
+    blocks.append(ipv4)
+    
+    if np is not None:
+        packed = np.concatenate([np.asarray(block, dtype=np.uint32) for block in blocks])
+        # Sort and drop repeats by hand: np.unique is an order of magnitude
+        # slower on multi-million address inputs
+        packed.sort()
+        if len(packed):
+            packed = packed[np.concatenate(([True], packed[1:] != packed[:-1]))]
+    else:
+        packed = array.array("I", sorted(set(itertools.chain.from_iterable(blocks))))
+    if others:
+        return [*packed.tolist(), *sorted(others)]
+    return packed
+
+
+def read_ips_from_file(filename: str) -> Iterator[Sequence[Target]]:
+    """
+    Read IP addresses from a file as sources for unique_sorted_ips().
+    
+    Lines are read one at a time and each range becomes a packed block (see
+    expand_ip_range), so a /8 entry costs 4 bytes per address rather than a
+    Python object each, and blocks are merged as arrays.
+    
+    Args:
+        filename: Path to file containing IP addresses (one per line)
+        
+    Yields:
+        A packed block per range and a one-item list per other entry
     """
     try:
         with open(filename, 'r') as f:
-            ips = []
             for line in f:
                 line = line.strip()
                 if line and not line.startswith('#'):  # Skip empty lines and comments
                     # Check if line contains a range
                     if '/' in line or '-' in line:
-                        expanded_ips = expand_ip_range(line)
-                        ips.extend(expanded_ips)
+                        yield expand_ip_range(line)
                     else:
-                        ips.append(line)
-            return ips
+                        yield [line]
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
@@ -159,51 +805,291 @@ def read_ips_from_file(filename: str) -> List[str]:
         sys.exit(1)
 
 
-def check_ips_parallel(ip_addresses: List[str], timeout: int = 3, count: int = 1, max_workers: int = 10, show_progress: bool = False) -> List[Tuple[str, bool, str]]:
+def _system_cpu_times() -> Optional[Tuple[float, float]]:
     """
-    Check multiple IP addresses in parallel.
+    Sample machine-wide CPU time.
+    
+    Uses psutil when installed, otherwise /proc/stat.
+    
+    Returns:
+        Tuple of (busy_seconds, total_seconds) summed over all CPUs, or None
+        if CPU times are not available on this platform
+    """
+    if psutil is not None:
+        times = psutil.cpu_times()
+        idle = times.idle + getattr(times, "iowait", 0.0)
+        # Linux already counts guest time in user and nice
+        total = sum(times) - getattr(times, "guest", 0.0) - getattr(times, "guest_nice", 0.0)
+        return (total - idle, total)
+    
+    try:
+        with open("/proc/stat") as f:
+            fields = [int(value) for value in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    ticks = os.sysconf("SC_CLK_TCK")
+    # Fields: user nice system idle iowait irq softirq steal ...
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+    total = sum(fields[:8])
+    return ((total - idle) / ticks, total / ticks)
+
+
+def _own_cpu_time() -> float:
+    """Return CPU seconds used by this process and its reaped children."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class FriendlyPool(concurrent.futures.Executor):
+    """
+    Thread pool that sizes its active workers to the CPU left by others.
+    
+    A daemon control thread samples CPU usage every `poll_interval` seconds
+    and allows `oversubscription * (cpu_self + cpu_idle) / cpu_all * CPUs`
+    workers to run, where the oversubscription factor lets an otherwise idle
+    machine use all `max_workers` threads. Workers above the target park
+    before starting their next task and are woken when the target grows.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, poll_interval: float = 0.01):
+        self._cpus = os.cpu_count() or 1
+        self._max_workers = max_workers or self._cpus
+        self._oversubscription = self._max_workers / self._cpus
+        self._poll_interval = poll_interval
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        self._active_target = self._max_workers
+        self._running = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._controller = threading.Thread(target=self._control_loop, daemon=True)
+        self._controller.start()
+    
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+    
+    def _run(self, fn, *args, **kwargs):
+        with self._cond:
+            while self._running >= self._active_target:
+                self._cond.wait()
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._cond.notify()
+    
+    def _control_loop(self):
+        """Periodically recompute how many workers may run."""
+        last_system = _system_cpu_times()
+        last_own = _own_cpu_time()
+        if last_system is None:
+            return
+        
+        while not self._stop.wait(self._poll_interval):
+            system = _system_cpu_times()
+            own = _own_cpu_time()
+            busy = system[0] - last_system[0]
+            total = system[1] - last_system[1]
+            own_busy = own - last_own
+            if total <= 0:
+                # No tick elapsed since the last sample
+                continue
+            last_system, last_own = system, own
+            
+            others = min(max(busy - own_busy, 0.0), total)
+            share = 1.0 - others / total
+            target = round(self._oversubscription * share * self._cpus)
+            with self._cond:
+                self._active_target = min(self._max_workers, max(1, target))
+                self._cond.notify_all()
+    
+    def shutdown(self, wait: bool = True, **kwargs):
+        self._stop.set()
+        self._executor.shutdown(wait=wait, **kwargs)
+
+
+def _ping_chunk(ip_addresses: Sequence[Target], timeout: int = 3, count: int = 1) -> List[Tuple[Target, bool, str]]:
+    """Ping a chunk of addresses as a single worker task."""
+    return [ping_ip(ip, timeout, count) for ip in ip_addresses]
+
+
+def _progress_reporter(total: int, show_progress: bool) -> Callable[[Tuple[Target, bool, str]], None]:
+    """
+    Create a callback printing one progress line per completed ping.
+    
+    Lines are buffered and written with a single write() every
+    PROGRESS_FLUSH_LINES results, with the first result arriving
+    PROGRESS_FLUSH_INTERVAL or more after the last write, and after the last
+    result. Nothing is written between results, so while the remaining
+    hosts are timing out, buffered lines can wait up to a ping timeout.
+    
+    Args:
+        total: Number of IP addresses being checked
+        show_progress: Whether to print anything at all
+        
+    Returns:
+        Callback taking a (ip_address, is_alive, message) result
+    """
+    completed = 0
+    buffer = []
+    last_flush = time.monotonic()
+    
+    def report(result: Tuple[Target, bool, str]):
+        nonlocal completed, last_flush
+        completed += 1
+        if not show_progress:
+            return
+        
+        status = PROGRESS_ALIVE if result[1] else PROGRESS_DEAD
+        buffer.append(f"  [{completed:3d}/{total:3d}] {status} {format_ip(result[0])}\n")
+        now = time.monotonic()
+        if len(buffer) >= PROGRESS_FLUSH_LINES or completed >= total or now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+            sys.stdout.write("".join(buffer))
+            sys.stdout.flush()
+            buffer.clear()
+            last_flush = now
+    
+    return report
+
+
+async def _check_ips_async(ip_addresses: Sequence[Target], timeout: int = 3, count: int = 1, show_progress: bool = False) -> List[Tuple[Target, bool, str]]:
+    """
+    Check multiple IP addresses concurrently over a shared ICMP socket.
     
     Args:
         ip_addresses: List of IP addresses to check
         timeout: Timeout in seconds for each ping
         count: Number of ping packets to send
-        max_workers: Maximum number of concurrent ping operations
         show_progress: Whether to show progress indicators
         
     Returns:
         List of tuples containing (ip_address, is_alive, message)
+        
+    Raises:
+        OSError: If ICMP sockets are not permitted
+        NotImplementedError: If the event loop cannot watch sockets (proactor)
     """
+    prober = IcmpProber()
+    report = _progress_reporter(len(ip_addresses), show_progress)
+    targets = _iter_targets(ip_addresses)
+    
+    # A bounded set of probe loops pulls from the shared iterator, keeping
+    # at most MAX_ICMP_IN_FLIGHT requests (and coroutines) alive at once
+    async def probe_loop() -> List[Tuple[Target, bool, str]]:
+        results = []
+        for ip in targets:
+            result = await prober.ping(ip, timeout, count)
+            report(result)
+            results.append(result)
+        return results
+    
+    if show_progress:
+        print(f"Checking {len(ip_addresses)} IP addresses over a shared ICMP socket...")
+    
+    try:
+        loops = min(MAX_ICMP_IN_FLIGHT, len(ip_addresses))
+        batches = await asyncio.gather(*[probe_loop() for _ in range(loops)])
+        return [result for batch in batches for result in batch]
+    finally:
+        prober.close()
+
+
+def check_ips_parallel(ip_addresses: Sequence[Target], timeout: int = 3, count: int = 1, max_workers: int = 10, show_progress: bool = False, adaptive: bool = False) -> List[Tuple[Target, bool, str]]:
+    """
+    Check multiple IP addresses in parallel.
+    
+    Args:
+        ip_addresses: IP addresses to check, IPv4 as integers (e.g. the packed
+                      array from unique_sorted_ips) or strings
+        timeout: Timeout in seconds for each ping
+        count: Number of ping packets to send
+        max_workers: Maximum number of concurrent ping operations when
+                     falling back to the ping utility, capped at
+                     MAX_WORKERS_CEILING
+        show_progress: Whether to show progress indicators
+        adaptive: Resize the ping utility worker pool to the CPU time left
+                  by other processes (FriendlyPool) instead of using a fixed
+                  process pool
+        
+    Returns:
+        List of tuples containing (ip_address, is_alive, message)
+    """
+    ipv4_only = _is_packed(ip_addresses)
+    if _windows_icmp.available() and (ipv4_only or all(_windows_icmp.accepts(ip) for ip in ip_addresses)):
+        if show_progress:
+            print(f"Checking {len(ip_addresses)} IP addresses through IcmpSendEcho2...")
+        return _windows_icmp.probe(ip_addresses, timeout, count,
+                                   on_result=_progress_reporter(len(ip_addresses), show_progress))
+    
+    if _uring_prober.available() and (ipv4_only or _uring_prober.accepts(ip_addresses)):
+        try:
+            prober = _uring_prober.UringProber()
+        except OSError:
+            # No ICMP socket or io_uring not permitted: use the asyncio prober
+            prober = None
+        if prober is not None:
+            try:
+                if show_progress:
+                    print(f"Checking {len(ip_addresses)} IP addresses through io_uring...")
+                return prober.probe(ip_addresses, timeout, count,
+                                    on_result=_progress_reporter(len(ip_addresses), show_progress))
+            finally:
+                prober.close()
+    
+    try:
+        return asyncio.run(_check_ips_async(ip_addresses, timeout, count, show_progress))
+    except (OSError, NotImplementedError):
+        # ICMP sockets not permitted or not pollable by the event loop, fall
+        # back to one ping process per worker
+        pass
+    
     results = []
-    completed = 0
     total = len(ip_addresses)
+    report = _progress_reporter(total, show_progress)
+    # Install the ping timeout handler before any worker needs it: pool
+    # threads cannot install it themselves and forked processes inherit it
+    _install_child_reaper()
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all ping tasks
-        future_to_ip = {
-            executor.submit(ping_ip, ip, timeout, count): ip 
-            for ip in ip_addresses
-        }
-        
+    # Cap concurrency to the number of targets and to what the CPUs can serve
+    if max_workers > MAX_WORKERS_CEILING:
+        print(f"Warning: Limiting workers to {MAX_WORKERS_CEILING} (requested {max_workers})")
+    max_workers = max(1, min(max_workers, total, MAX_WORKERS_CEILING))
+    
+    # Worker processes sidestep the GIL for the Python-side ping plumbing;
+    # chunking amortizes the IPC cost of shipping tasks and results
+    chunksize = max(1, min(MAX_CHUNK_SIZE, total // (max_workers * 4)))
+    targets = _iter_targets(ip_addresses)
+    chunks = iter(lambda: list(itertools.islice(targets, chunksize)), [])
+    if adaptive:
+        executor = FriendlyPool(max_workers=max_workers)
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+    
+    with executor:
         if show_progress:
-            print(f"Checking {total} IP addresses with {min(max_workers, total)} concurrent connections...")
+            print(f"Checking {total} IP addresses with {max_workers} concurrent connections...")
+        elif total > 1:
+            print(f"Using {max_workers} concurrent connections")
         
-        # Collect results as they complete
-        for future in concurrent.futures.as_completed(future_to_ip):
-            result = future.result()
-            results.append(result)
-            completed += 1
-            
-            if show_progress:
-                ip = future_to_ip[future]
-                status = "✓" if result[1] else "✗"
-                color = "\033[92m" if result[1] else "\033[91m"
-                reset = "\033[0m"
-                print(f"  [{completed:3d}/{total:3d}] {color}{status}{reset} {ip}")
+        # Keep at most 2 * max_workers chunks submitted, so pending futures
+        # stay O(workers) no matter how many addresses are checked
+        pending = set()
+        while True:
+            for chunk in itertools.islice(chunks, 2 * max_workers - len(pending)):
+                pending.add(executor.submit(_ping_chunk, chunk, timeout, count))
+            if not pending:
+                break
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    results.append(result)
+                    report(result)
     
     return results
 
 
-def print_results(results: List[Tuple[str, bool, str]], show_summary: bool = True, round_robin: bool = False, timestamp: str = ""):
+def print_results(results: List[Tuple[Target, bool, str]], show_summary: bool = True, round_robin: bool = False, timestamp: str = ""):
     """
     Print the ping results in a formatted table.
     
@@ -218,45 +1104,124 @@ def print_results(results: List[Tuple[str, bool, str]], show_summary: bool = Tru
         return
     
     # Sort results by IP address
-    results.sort(key=lambda x: x[0])
+    results.sort(key=lambda x: _ip_sort_key(x[0]))
     
+    # Build the whole table and write it at once
+    lines = []
     if round_robin:
-        print(f"\n[{timestamp}] Round Robin Check Results:")
-        print("-" * 60)
+        lines.append(f"\n[{timestamp}] Round Robin Check Results:")
+        lines.append("-" * 60)
+        row = "  {:<18} {} {}".format
     else:
-        # Print header
-        print("\n" + "="*60)
-        print(f"{'IP Address':<20} {'Status':<10} {'Details'}")
-        print("="*60)
+        # Header
+        lines.append("\n" + "="*60)
+        lines.append(f"{'IP Address':<20} {'Status':<10} {'Details'}")
+        lines.append("="*60)
+        row = "{:<20} {} {}".format
     
-    # Print results
+    # Results
     alive_count = 0
-    for ip, is_alive, message in results:
-        status = "✓ ALIVE" if is_alive else "✗ DEAD"
-        status_color = "\033[92m" if is_alive else "\033[91m"  # Green for alive, red for dead
-        reset_color = "\033[0m"
-        
-        if round_robin:
-            print(f"  {ip:<18} {status_color}{status:<10}{reset_color} {message}")
-        else:
-            print(f"{ip:<20} {status_color}{status:<10}{reset_color} {message}")
-        
+    addresses = _format_ips([ip for ip, _, _ in results])
+    for address, (_, is_alive, message) in zip(addresses, results):
+        lines.append(row(address, STATUS_ALIVE if is_alive else STATUS_DEAD, message))
         if is_alive:
             alive_count += 1
     
-    # Print summary
+    # Summary
     if show_summary:
         total_count = len(results)
         dead_count = total_count - alive_count
         if round_robin:
-            print(f"  Status: {alive_count}/{total_count} alive ({(alive_count/total_count)*100:.1f}%)")
+            lines.append(f"  Status: {alive_count}/{total_count} alive ({(alive_count/total_count)*100:.1f}%)")
         else:
-            print("="*60)
-            print(f"Summary: {alive_count}/{total_count} hosts alive, {dead_count}/{total_count} hosts unreachable")
-            print(f"Success rate: {(alive_count/total_count)*100:.1f}%")
+            lines.append("="*60)
+            lines.append(f"Summary: {alive_count}/{total_count} hosts alive, {dead_count}/{total_count} hosts unreachable")
+            lines.append(f"Success rate: {(alive_count/total_count)*100:.1f}%")
+    
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
-def round_robin_monitor(ip_addresses: List[str], interval: int = 10, timeout: int = 3, count: int = 1):
+async def _aping(ip_address: Target, timeout: int = 3, count: int = 1) -> Tuple[Target, bool, str]:
+    """
+    Ping an IP address with the system ping utility without blocking the event loop.
+    
+    Args:
+        ip_address: The IP address to ping
+        timeout: Timeout in seconds for each ping
+        count: Number of ping packets to send
+        
+    Returns:
+        Tuple of (ip_address, is_alive, message)
+    """
+    if _windows_icmp.available() and _windows_icmp.accepts(ip_address):
+        return await asyncio.get_running_loop().run_in_executor(None, ping_ip, ip_address, timeout, count)
+    
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_ping_command(format_ip(ip_address), timeout, count),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            returncode = await asyncio.wait_for(proc.wait(), timeout + SUBPROCESS_GRACE)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return (ip_address, False, "Timeout")
+        
+        if returncode == 0:
+            return (ip_address, True, "Alive")
+        return (ip_address, False, "Not reachable")
+    except Exception as e:
+        return (ip_address, False, f"Error: {str(e)}")
+
+
+async def _check_round(prober: Optional[IcmpProber], ip_addresses: Sequence[Target], timeout: int, count: int, in_flight: int) -> Tuple[List[Tuple[Target, bool, str]], int, float]:
+    """
+    Ping every address once, keeping at most `in_flight` requests outstanding.
+    
+    Args:
+        prober: Shared ICMP prober, or None to use the ping utility
+        ip_addresses: List of IP addresses to check
+        timeout: Timeout for each ping
+        count: Number of ping packets per check
+        in_flight: Maximum number of concurrent echo requests or ping
+                   processes (capped at MAX_ICMP_IN_FLIGHT)
+        
+    Returns:
+        Tuple of (results, number of replies, seconds from the start of
+        the round to the last reply)
+    """
+    semaphore = asyncio.Semaphore(min(in_flight, MAX_ICMP_IN_FLIGHT))
+    report = _progress_reporter(len(ip_addresses), True)
+    replies = 0
+    start = last_reply = time.perf_counter()
+    
+    async def probe(ip: Target) -> Tuple[Target, bool, str]:
+        nonlocal replies, last_reply
+        async with semaphore:
+            if prober is None:
+                result = await _aping(ip, timeout, count)
+            else:
+                try:
+                    rtt = await prober.ping_rtt(ip, timeout, count)
+                    if rtt is not None:
+                        replies += 1
+                        last_reply = time.perf_counter()
+                        result = (ip, True, "Alive")
+                    else:
+                        result = (ip, False, "Not reachable")
+                except Exception as e:
+                    result = (ip, False, f"Error: {str(e)}")
+        report(result)
+        return result
+    
+    results = await asyncio.gather(*[probe(ip) for ip in ip_addresses])
+    return (results, replies, last_reply - start)
+
+
+async def round_robin_monitor(ip_addresses: Sequence[Target], interval: int = 10, timeout: int = 3, count: int = 1):
     """
     Continuously monitor IP addresses in round robin fashion.
     
@@ -266,68 +1231,93 @@ def round_robin_monitor(ip_addresses: List[str], interval: int = 10, timeout: in
         timeout: Timeout for each ping
         count: Number of ping packets per check
     """
+    ip_addresses = list(_iter_targets(ip_addresses))
     print(f"Starting round robin monitoring of {len(ip_addresses)} IP addresses")
     print(f"Check interval: {interval} seconds")
     print(f"Ping timeout: {timeout} seconds, Count: {count}")
     print("Press Ctrl+C to stop monitoring\n")
     
-    # Setup signal handler for graceful exit
+    # Track statistics
+    check_count = 0
+    history = {ip: collections.deque(maxlen=HISTORY_LENGTH) for ip in ip_addresses}
+    
+    # Setup signal handler for graceful exit: it is the only way out of the
+    # loop, so it reports the final statistics before exiting
     def signal_handler(signum, frame):
         print("\n\nMonitoring stopped by user")
+        
+        # Show final statistics
+        print("\nFinal Statistics:")
+        for ip in ip_addresses:
+            if history[ip]:
+                total_checks = len(history[ip])
+                successful_checks = sum(history[ip])
+                uptime = (successful_checks / total_checks) * 100
+                print(f"  {format_ip(ip)}: {successful_checks}/{total_checks} successful ({uptime:.1f}% uptime)")
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
+    now = datetime.now
     
-    # Track statistics
-    check_count = 0
-    history = {ip: [] for ip in ip_addresses}
+    # Pipeline depth, grown by slow start. The reply rate is bounded by the
+    # window itself, so it cannot size the window directly; it only tells
+    # whether the last increase still paid off
+    in_flight = MIN_IN_FLIGHT
+    best_rate = 0.0
+    growing = True
+    
+    try:
+        prober = IcmpProber()
+    except (OSError, NotImplementedError):
+        # ICMP sockets not permitted or not pollable by the event loop, run
+        # the ping utility as subprocesses
+        prober = None
     
     try:
         while True:
             check_count += 1
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = now().strftime(TIMESTAMP_FORMAT)
             
-            # Check all IPs with real-time progress
-            results = []
-            print(f"  Checking {len(ip_addresses)} IP addresses...")
+            # Check all IPs with real-time progress. Ping utility checks never
+            # report round-trip times to size the window from, so they run
+            # as many processes at once as the CPUs can serve instead
+            window = in_flight if prober is not None else MAX_WORKERS_CEILING
+            print(f"  Checking {len(ip_addresses)} IP addresses ({min(window, len(ip_addresses))} in flight)...")
+            results, replies, active = await _check_round(prober, ip_addresses, timeout, count, window)
+            
+            # Keep widening the window while it raises the reply rate
+            if growing and replies and active > 0 and in_flight < min(len(ip_addresses), MAX_ICMP_IN_FLIGHT):
+                rate = replies / active
+                if rate >= best_rate * MIN_RATE_GAIN:
+                    best_rate = rate
+                    in_flight = min(len(ip_addresses), MAX_ICMP_IN_FLIGHT, in_flight * WINDOW_GROWTH)
+                else:
+                    in_flight = max(MIN_IN_FLIGHT, in_flight // WINDOW_GROWTH)
+                    growing = False
             
-            for i, ip in enumerate(ip_addresses, 1):
-                print(f"  [{i:3d}/{len(ip_addresses):3d}]", end=" ")
-                result = ping_ip(ip, timeout, count, show_progress=True)
-                results.append(result)
-                
-                # Store in history (keep last 10 results per IP)
-                history[ip].append(result[1])  # Store only alive/dead status
-                if len(history[ip]) > 10:
-                    history[ip].pop(0)
+            for ip, is_alive, _ in results:
+                # Store in history; the deque drops results beyond the last HISTORY_LENGTH
+                history[ip].append(is_alive)  # Store only alive/dead status
             
             # Print results
             print_results(results, show_summary=True, round_robin=True, timestamp=timestamp)
             
             # Show uptime statistics every 10 checks
             if check_count % 10 == 0:
-                print(f"\n  Uptime Statistics (last {min(10, check_count)} checks):")
+                print(f"\n  Uptime Statistics (last {min(HISTORY_LENGTH, check_count)} checks):")
                 for ip in ip_addresses:
                     if history[ip]:
                         uptime = (sum(history[ip]) / len(history[ip])) * 100
-                        print(f"    {ip}: {uptime:.1f}% uptime")
+                        print(f"    {format_ip(ip)}: {uptime:.1f}% uptime")
                 print()
             
-            # Wait for next check
+            # Wait for next check (asyncio.sleep runs on the loop's monotonic
+            # clock, so wall clock changes do not affect the interval)
             print(f"  Next check in {interval} seconds... (Check #{check_count})")
-            time.sleep(interval)
-            
-    except KeyboardInterrupt:
-        print("\n\nMonitoring stopped by user")
-        
-        # Show final statistics
-        print("\nFinal Statistics:")
-        for ip in ip_addresses:
-            if history[ip]:
-                total_checks = len(history[ip])
-                successful_checks = sum(history[ip])
-                uptime = (successful_checks / total_checks) * 100
-                print(f"  {ip}: {successful_checks}/{total_checks} successful ({uptime:.1f}% uptime)")
+            await asyncio.sleep(interval)
+    finally:
+        if prober is not None:
+            prober.close()
 
 
 def main():
@@ -360,7 +1350,11 @@ Examples:
     parser.add_argument('--count', '-c', type=int, default=1,
                        help='Number of ping packets to send (default: 1)')
     parser.add_argument('--workers', '-w', type=int, default=10,
-                       help='Maximum number of concurrent ping operations (default: 10)')
+                       help='Maximum number of concurrent ping operations (default: 10, ' +
+                            f'capped at {MAX_WORKERS_CEILING} on this machine)')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Grow and shrink the ping worker pool with the CPU time left ' +
+                            'by other processes (only used when falling back to the ping utility)')
     
     # Round robin options
     parser.add_argument('--round-robin', '-r', action='store_true',
@@ -378,30 +1372,32 @@ Examples:
     
     args = parser.parse_args()
     
-    # Get list of IP addresses
-    ip_addresses = []
+    # Get the IP addresses from every source; IPv4 addresses stay integers
+    sources = []
     
     if args.file:
-        file_ips = read_ips_from_file(args.file)
-        if file_ips:
-            ip_addresses.extend(file_ips)
-        else:
+        file_sources = list(read_ips_from_file(args.file))
+        if not any(len(source) for source in file_sources):
             print(f"No valid IP addresses found in file '{args.file}'")
             sys.exit(1)
+        sources.extend(file_sources)
     
     if args.ip_addresses:
         for ip_arg in args.ip_addresses:
             # Check if it's a range or CIDR
             if '/' in ip_arg or '-' in ip_arg:
                 expanded_ips = expand_ip_range(ip_arg)
-                if expanded_ips:
-                    ip_addresses.extend(expanded_ips)
+                if len(expanded_ips):
+                    sources.append(expanded_ips)
                 else:
                     print(f"Warning: Could not parse IP range '{ip_arg}'")
             else:
-                ip_addresses.append(ip_arg)
+                sources.append([ip_arg])
+    
+    # Ping each host once even when ranges, files and arguments overlap
+    ip_addresses = unique_sorted_ips(*sources)
     
-    if not ip_addresses:
+    if not len(ip_addresses):
         print("Error: No IP addresses provided. Use either command line arguments or --file option.")
         parser.print_help()
         sys.exit(1)
@@ -419,21 +1415,23 @@ Examples:
         print("Error: Interval must be at least 1 second")
         sys.exit(1)
     
+    if args.workers < 1:
+        print("Error: Workers must be at least 1")
+        sys.exit(1)
+    
     # Round robin mode
     if args.round_robin:
-        round_robin_monitor(
+        asyncio.run(round_robin_monitor(
             ip_addresses, 
             interval=args.interval,
             timeout=args.timeout, 
             count=args.count
-        )
+        ))
         return
     
     # One-time check mode
     if not args.show_progress:
         print(f"Checking {len(ip_addresses)} IP address(es)...")
-        if len(ip_addresses) > 1:
-            print(f"Using {min(args.workers, len(ip_addresses))} concurrent connections")
     
     start_time = time.time()
     
@@ -443,7 +1441,8 @@ Examples:
         timeout=args.timeout, 
         count=args.count,
         max_workers=args.workers,
-        show_progress=args.show_progress
+        show_progress=args.show_progress,
+        adaptive=args.adaptive
     )
     
     end_time = time.time()